@@ -1,6 +1,7 @@
-import asyncio
+import struct
+import time
 
-import serial_asyncio
+import serial
 
 # --- 設定項目 ---
 # ご自身の環境に合わせて変更してください
@@ -10,68 +11,55 @@ MOTOR_CAN_ID = 1  # 確認したいモーターのCAN ID（初期値は127）
 HOST_CAN_ID = 253  # ホスト側(PC)のID (任意だが0以外)
 # -----------------
 
+# ATコマンドフレーム (ヘッダ, エンコード済みCAN ID, フレーム情報, データ, 終端) のパッカー
+FRAME_PACK = struct.Struct('>2sIBQ2s').pack
+
 
 def create_at_command(
     command_type: int, motor_id: int, host_id: int, data_payload: int
 ) -> bytes:
     """ATモードのコマンドフレームを生成する"""
 
-    # 1. CAN拡張IDを構築 (29ビット)
+    # 1. CAN拡張ID (29ビット) を構築し、USB-CANツールの特殊なエンコーディングを適用
     # Bit 28-24: 通信タイプ, Bit 23-8: ホストID, Bit 7-0: モーターID
-    can_id_29bit = (command_type << 24) | (host_id << 8) | motor_id
-
-    # 2. USB-CANツールの特殊なエンコーディングを適用
     # マニュアルの変換例から、29ビットIDの末尾にバイナリの'100'を追加すると推測
-    encoded_id_32bit = (can_id_29bit << 3) | 0b100
+    encoded_id_32bit = (command_type << 27) | (host_id << 11) | (motor_id << 3) | 0b100
 
-    # 3. ATコマンドの各パーツをバイト列で作成
-    header = b'\x41\x54'  # "AT"
-    encoded_id_bytes = encoded_id_32bit.to_bytes(4, 'big')
-    extended_frame_flag = b'\x08'
-    data = data_payload.to_bytes(8, 'big')  # データフィールド
-    tail = b'\x0d\x0a'  # CR+LF
+    # 2. ATコマンドの各パーツを1回のパックでバイト列にする
+    # "AT" + エンコード済みID + フレーム情報(0x08) + データフィールド + CR+LF
+    return FRAME_PACK(b'\x41\x54', encoded_id_32bit, 0x08, data_payload, b'\x0d\x0a')
 
-    return header + encoded_id_bytes + extended_frame_flag + data + tail
 
+# 疎通確認用の「デバイスID取得（タイプ0）」コマンド
+# このコマンドはモーターにデータを要求するだけで、状態を変更しないため安全です
+# データペイロードは0でなければなりません
+COMMAND_TO_SEND = create_at_command(
+    command_type=0, motor_id=MOTOR_CAN_ID, host_id=HOST_CAN_ID, data_payload=0
+)
 
-async def main() -> None:
-    """非同期メイン処理"""
-    # 疎通確認用の「デバイスID取得（タイプ0）」コマンドを生成
-    # このコマンドはモーターにデータを要求するだけで、状態を変更しないため安全です
-    # データペイロードは0でなければなりません
-    command_to_send = create_at_command(
-        command_type=0, motor_id=MOTOR_CAN_ID, host_id=HOST_CAN_ID, data_payload=0
-    )
 
+def main() -> None:
+    """メイン処理"""
     print(f"シリアルポート {SERIAL_PORT} を開きます...")
 
     try:
-        reader, writer = await serial_asyncio.open_serial_connection(
-            url=SERIAL_PORT, baudrate=BAUDRATE, timeout=1.0
-        )
-
-        print("ポートを開きました。")
-
-        print(f"送信コマンド (HEX): {command_to_send.hex(' ')}")
-        writer.write(command_to_send)
-        await writer.drain()
-        print("コマンドを送信しました。応答を待っています...")
+        with serial.Serial(SERIAL_PORT, BAUDRATE, timeout=1.0) as ser:
+            print("ポートを開きました。")
 
-        await asyncio.sleep(0.5)  # 応答を待つための短いウェイト
+            print(f"送信コマンド (HEX): {COMMAND_TO_SEND.hex(' ')}")
+            ser.write(COMMAND_TO_SEND)
+            print("コマンドを送信しました。応答を待っています...")
 
-        try:
-            response = await asyncio.wait_for(reader.read(100), timeout=1.0)
-        except asyncio.TimeoutError:
-            response = b''
+            time.sleep(0.5)  # 応答を待つための短いウェイト
 
-        if response:
-            print("\n✅ 応答を受信しました！ 疎通成功です。")
-            print(f"受信データ (HEX): {response.hex(' ')}")
-        else:
-            print("\n❌ 応答がありませんでした。")
+            # 受信済みのデータを読み込む（無ければ最大1秒待つ）
+            response = ser.read(max(ser.in_waiting, 1))
 
-        writer.close()
-        await writer.wait_closed()
+            if response:
+                print("\n✅ 応答を受信しました！ 疎通成功です。")
+                print(f"受信データ (HEX): {response.hex(' ')}")
+            else:
+                print("\n❌ 応答がありませんでした。")
 
     except Exception as e:
         print("\nエラー: シリアルポートを開けませんでした。")
@@ -81,4 +69,4 @@ async def main() -> None:
 
 # --- メイン処理 ---
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
@@ -1,27 +1,101 @@
 import asyncio
 import logging
 import math
+import os
 import struct
+import time
 from asyncio import Lock
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from logging import Formatter, StreamHandler, getLogger
-from typing import Any, Optional, Union
+from typing import Any, Iterable, Optional, Union
 
-import serial_asyncio
+import serial
 
 from .constants import CommandType, MotorStatus, ParameterIndex, RunMode
 
 # Improved logger configuration
 logger = getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+logger.setLevel(logging.INFO)
 handler_format = Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 stream_handler = StreamHandler()
 stream_handler.setLevel(logging.INFO)
 stream_handler.setFormatter(handler_format)
-logger.addHandler(stream_handler)
-
-
-@dataclass
+# モジュールの再読み込み時にハンドラが重複し、ログが二重に出力されるのを防ぐ
+if not logger.handlers:
+    logger.addHandler(stream_handler)
+
+# data_area2 にホストIDを格納するコマンド
+_HOST_ID_COMMANDS = frozenset(
+    {CommandType.GET_DEVICE_ID, CommandType.ENABLE, CommandType.DISABLE}
+)
+
+# 各コマンドに対する応答フレームの通信タイプ
+# (有効化・無効化・パラメータ書き込みにはタイプ2のモーターフィードバックが返る)
+_RESPONSE_TYPES = {
+    CommandType.GET_DEVICE_ID: 0x00,
+    CommandType.ENABLE: 0x02,
+    CommandType.DISABLE: 0x02,
+    CommandType.READ_PARAM: 0x11,
+    CommandType.WRITE_PARAM: 0x02,
+}
+_COMMAND_TYPES = {command_type.value: command_type for command_type in CommandType}
+_WRITE_ACK_TYPE = _RESPONSE_TYPES[CommandType.WRITE_PARAM]
+_READ_RESPONSE_TYPE = _RESPONSE_TYPES[CommandType.READ_PARAM]
+
+# フィードバック応答の2ビットの状態値 (0-3) をそのまま添字にする MotorStatus の対応表
+_STATUS_TABLE = (
+    MotorStatus.RESET,
+    MotorStatus.CALIBRATION,
+    MotorStatus.RUN,
+    MotorStatus.UNKNOWN,
+)
+
+# 高頻度で送信する指令値のパラメータインデックス (Enum の属性参照を避ける)
+_IDX_LOC_REF = ParameterIndex.LOC_REF.value
+_IDX_SPD_REF = ParameterIndex.SPD_REF.value
+_IDX_IQ_REF = ParameterIndex.IQ_REF.value
+
+# 17バイトフレーム (ヘッダ, エンコード済みCAN ID, フレーム情報, データ, 終端) のパッカー
+_FRAME_PACK = struct.Struct('>2sIB8s2s').pack
+_FRAME_HEADER = b'\x41\x54'  # "AT"
+_FRAME_TAIL = b'\x0d\x0a'  # CR+LF
+_ZERO_PAYLOAD = bytes(8)
+
+# 読み戻しで反映が確認できなかった場合の再確認までの待機時間 (秒)。段階的に延ばす
+_VERIFY_DELAYS = (0.001, 0.002, 0.005, 0.02, 0.1)
+
+# パラメータ読み書き用ペイロード (index, 予約(0埋め), 値) の事前コンパイル済みパッカー
+_READ_PAYLOAD = struct.Struct('<H6x').pack
+_WRITE_INT = struct.Struct('<H2xI').pack
+_WRITE_FLT = struct.Struct('<H2xf').pack
+_PACK_F = struct.Struct('<f').pack
+_FLOAT_PACK_INTO = struct.Struct('<f').pack_into
+
+# 応答解析用の事前コンパイル済みアンパッカー
+_UNPACK_F = struct.Struct('<f').unpack
+_UNPACK_BE_ID = struct.Struct('>I').unpack_from
+_UNPACK_INDEX = struct.Struct('<H').unpack_from
+
+
+def _decode_can_id(frame: bytes) -> tuple[int, int, int]:
+    """フレームのCAN IDを (通信タイプ, データエリア2, 宛先アドレス) に分解します。"""
+    can_id_29bit = _UNPACK_BE_ID(frame, 2)[0] >> 3
+    return can_id_29bit >> 24, (can_id_29bit >> 8) & 0xFFFF, can_id_29bit & 0xFF
+
+
+def _response_key(frame: bytes) -> tuple[int, int, int]:
+    """送信フレームに対応する応答の (モーターID, 通信タイプ, パラメータインデックス) を返します。"""
+    comm_type, _, motor_id = _decode_can_id(frame)
+    response_type = _RESPONSE_TYPES[_COMMAND_TYPES[comm_type]]
+    # パラメータ読み込みの応答は読み込んだインデックスを返すため、インデックスでも対応付ける
+    index = _UNPACK_INDEX(frame, 7)[0] if response_type == _READ_RESPONSE_TYPE else 0
+    return motor_id, response_type, index
+
+
+@dataclass(slots=True)
 class RobStrideLimits:
     """RobStrideモーターの制限パラメータを管理するクラス"""
 
@@ -38,8 +112,11 @@ class RobStrideLimits:
     csp_limit_spd: Optional[float] = None  # 速度制限 (rad/s)
     csp_limit_cur: Optional[float] = None  # 電流制限 (A)
 
+    # Command rate limit (間隔未満の指令は最新の値のみ後で送信。停止指令 0.0 は制限の対象外)
+    min_command_period_s: Optional[float] = None  # 目標速度指令の最小送信間隔 (s)
+
 
-@dataclass
+@dataclass(slots=True)
 class RobStride:
     id: int
     offset: float  # in radians
@@ -71,98 +148,297 @@ class RobStrideController:
         motors: list[RobStride],
         baudrate: int = 921600,
         host_id: int = 253,
+        response_timeout: float = 1.0,
+        write_timeout: float = 1.0,
     ):
         self.port = port
         self.baudrate = baudrate
         self.motors = {motor.id: motor for motor in motors}
         self.host_id = host_id
-        self.reader: Optional[asyncio.StreamReader] = None
-        self.writer: Optional[asyncio.StreamWriter] = None
+        # 応答待ちのタイムアウト (秒)。応答が失われた場合の待ち時間の上限
+        self.response_timeout = response_timeout
+        # 送信が詰まった場合の書き込みの上限 (秒)。応答待ちとは独立に設定する
+        self.write_timeout = write_timeout
+        self.serial: Optional[serial.Serial] = None
+        # シリアルI/O専用スレッド。asyncioのスケジューリング遅延を回線から切り離す
+        self._io_executor: Optional[ThreadPoolExecutor] = None
+        # 受信専用スレッドとそれを駆動する受信タスク
+        self._rx_executor: Optional[ThreadPoolExecutor] = None
+        self._reader_task: Optional[asyncio.Task[None]] = None
+        # 受信スレッドが保持する未処理の受信バイト列 (フレームの途中まで)
+        self._rxbuf = bytearray()
+        # (モーターID, 応答の通信タイプ, パラメータインデックス) ごとの応答待ちFuture (送信順)。
+        # float は送信のみのフレームの応答を読み捨てる枠で、値はその期限 (loop.time)
+        self._pending: dict[
+            tuple[int, int, int], deque[Union[asyncio.Future[bytes], float]]
+        ] = {}
+        # 送信のみの枠が応答で消費された (または期限切れで読み飛ばされた) ことを通知するイベント
+        self._placeholder_events: dict[tuple[int, int, int], asyncio.Event] = {}
+        # ★ 送信のみを直列化するロック（応答はCAN IDで振り分ける）
         self.lock = Lock()
+        # 有効化済みモーターごとの (LOC_REF書き込みフレームの送信バッファ, オフセット)
+        self._pos_targets: dict[int, tuple[bytearray, float]] = {}
+        # モーターごとの最後に目標速度を送信した時刻 (time.monotonic)
+        self._last_command_times: dict[int, float] = {}
+        # 送信間隔に満たず保留中の最新の目標速度と、それを間隔の経過後に送信するタスク
+        self._deferred_velocities: dict[int, float] = {}
+        self._deferred_tasks: dict[int, asyncio.Task[None]] = {}
+
+        # (コマンド種別, モーターID, データエリア2) ごとのエンコード済みCAN IDを事前計算
+        self._encoded_ids: dict[tuple[CommandType, int, int], int] = {
+            (command_type, motor_id, self.host_id): self._encode_can_id(
+                command_type, motor_id, self.host_id
+            )
+            for command_type in CommandType
+            for motor_id in self.motors
+        }
+
+        # (モーターID, 運転モード) ごとの run_mode 書き込みフレームを事前生成
+        self._runmode_frames: dict[tuple[int, RunMode], bytes] = {
+            (motor_id, mode): self._create_frame(
+                CommandType.WRITE_PARAM,
+                motor_id,
+                self.host_id,
+                _WRITE_INT(ParameterIndex.RUN_MODE.value, mode.value),
+            )
+            for motor_id in self.motors
+            for mode in RunMode
+        }
+
+    @staticmethod
+    def _encode_can_id(
+        command_type: CommandType, motor_id: int, data_area2: int
+    ) -> int:
+        """29ビットCAN IDを構築し、USBCAN独自のエンコード ((id << 3) | 0b100) を適用します。"""
+        comm_type: int = command_type.value
+        return (comm_type << 27) | (data_area2 << 11) | (motor_id << 3) | 0b100
 
     def _create_frame(
         self,
         command_type: CommandType,
         motor_id: int,
         data_area2: int = 0,
-        data_payload: bytes = b'\x00' * 8,
+        data_payload: bytes = _ZERO_PAYLOAD,
     ) -> bytes:
-        if command_type in [
-            CommandType.GET_DEVICE_ID,
-            CommandType.ENABLE,
-            CommandType.DISABLE,
-        ]:
+        if command_type in _HOST_ID_COMMANDS:
             data_area2 = self.host_id
 
-        can_id_29bit = (command_type.value << 24) | (data_area2 << 8) | motor_id
-        encoded_id_32bit = (can_id_29bit << 3) | 0b100
-        header = b'\x41\x54'
-        encoded_id_bytes = encoded_id_32bit.to_bytes(4, 'big')
-        extended_frame_flag = b'\x08'
-        tail = b'\x0d\x0a'
-        byte = header + encoded_id_bytes + extended_frame_flag + data_payload + tail
-        assert isinstance(byte, bytes) and len(byte) == 17, "Frame must be 17 bytes"
-        return byte
-
-    async def _send_and_receive(self, frame: bytes) -> Optional[bytes]:
-        # ★ このロックが単一バスの混線を防ぐ
-        async with self.lock:
-            if not self.writer or self.writer.is_closing():
-                logger.error("Serial connection is not open")
-                return None
+        key = (command_type, motor_id, data_area2)
+        encoded_id_32bit = self._encoded_ids.get(key)
+        if encoded_id_32bit is None:
+            # 事前計算に無い組み合わせも初回に計算してキャッシュする
+            encoded_id_32bit = self._encode_can_id(command_type, motor_id, data_area2)
+            self._encoded_ids[key] = encoded_id_32bit
+        return _FRAME_PACK(
+            _FRAME_HEADER, encoded_id_32bit, 0x08, data_payload, _FRAME_TAIL
+        )
 
+    def _is_open(self) -> bool:
+        """シリアルポートが開いているかどうかを返します。"""
+        return self.serial is not None and self.serial.is_open
+
+    def _read_frames(self) -> list[bytes]:
+        """受信スレッド上で受信済みのデータを読み込み、完全なフレームを取り出します。"""
+        serial_port = self.serial
+        assert serial_port is not None
+        rxbuf = self._rxbuf
+        # 受信済みのデータはまとめて読み、無ければ1フレーム分 (17バイト) を待つ
+        rxbuf += serial_port.read(max(serial_port.in_waiting, 17 - len(rxbuf), 1))
+
+        # "AT" で始まり17バイト目が終端 (CR+LF) のものをフレームとして切り出す。
+        # 途中で切れたフレームは次回の読み込みに持ち越し、不正なバイトは読み捨てる
+        frames = []
+        start = 0
+        while True:
+            i = rxbuf.find(_FRAME_HEADER, start)
+            if i < 0:
+                # 末尾の "A" はヘッダの前半の可能性があるため残す
+                start = len(rxbuf) - 1 if rxbuf.endswith(b'A') else len(rxbuf)
+                break
+            if len(rxbuf) - i < 17:
+                start = i
+                break
+            if rxbuf[i + 15 : i + 17] == _FRAME_TAIL:
+                frames.append(bytes(rxbuf[i : i + 17]))
+                start = i + 17
+            else:
+                start = i + 1
+        del rxbuf[:start]
+
+        discarded = start - 17 * len(frames)
+        if discarded:
+            logger.error(f"Discarded {discarded} bytes of invalid response data")
+        return frames
+
+    async def _reader_loop(self) -> None:
+        """受信したフレームを応答待ちのFutureへ振り分け続けます。"""
+        loop = asyncio.get_running_loop()
+        while self._is_open():
             try:
-                # Clear any pending data in the reader
-                # Note: StreamReader doesn't have reset_input_buffer,
-                # but we can read and discard any pending data
-                while True:
-                    try:
-                        # Try to read with a very short timeout
-                        pending = await asyncio.wait_for(
-                            self.reader.read(1024), timeout=0.001
-                        )
-                        if not pending:
-                            break
-                    except asyncio.TimeoutError:
-                        break
-
-                # Send the frame
-                self.writer.write(frame)
-                await self.writer.drain()
-                logger.debug(f"Sent frame: {frame.hex(' ')}")
-
-                # Read response with timeout
-                response = await asyncio.wait_for(
-                    self.reader.readuntil(b'\x0d\x0a'), timeout=1.0
+                frames = await loop.run_in_executor(
+                    self._rx_executor, self._read_frames
                 )
-
-            except asyncio.TimeoutError:
-                logger.error("No response received from motor within timeout")
-                return None
             except Exception as e:
                 logger.error(f"Error during serial I/O: {e}")
-                return None
+                return
+            for response in frames:
+                self._dispatch_response(response)
+
+    def _dispatch_response(self, response: bytes) -> None:
+        # ヘッダ・終端・長さは _read_frames で切り出す際に検証済み
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received valid response: %s", response.hex(' '))
+
+        # 応答ではデータエリア2の下位8ビットに送信元のモーターIDが入る
+        comm_type, data_area2, _ = _decode_can_id(response)
+        # 読み込み応答はデータの先頭2バイトに要求したパラメータインデックスを返す
+        index = _UNPACK_INDEX(response, 7)[0] if comm_type == _READ_RESPONSE_TYPE else 0
+        key = (data_area2 & 0xFF, comm_type, index)
+        waiters = self._pending.get(key)
+        while waiters:
+            waiter = waiters.popleft()
+            if isinstance(waiter, float):
+                event = self._placeholder_events.get(key)
+                if event is not None:
+                    event.set()
+                # 送信のみのフレームへの応答は読み捨てる。期限切れの枠は応答が失われたとみなす
+                if waiter >= asyncio.get_running_loop().time():
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Discarding response to send-only frame: %s",
+                            response.hex(' '),
+                        )
+                    return
+                continue
+            if not waiter.done():
+                waiter.set_result(response)
+                return
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Discarding unsolicited response: %s", response.hex(' '))
+
+    async def _wait_placeholders(self, key: tuple[int, int, int]) -> None:
+        """送信のみのフレームの枠が消費されるか期限切れになるまで待ちます（最大 response_timeout）。
+
+        枠が残ったまま応答待ちを登録すると、応答の失われた送信のみのフレームの枠が
+        後続の応答を読み捨ててしまうため、ロック内で応答待ちを登録する直前に呼び出します。
+        """
+        waiters = self._pending.get(key)
+        if not waiters:
+            return
 
-            if response and response.startswith(b'AT') and response.endswith(b'\r\n'):
-                logger.debug(f"Received valid response: {response.hex(' ')}")
-                if len(response) == 17:
-                    return response
-                else:
-                    logger.error(
-                        f"Invalid response length: expected 17 bytes, got {len(response)}"
-                    )
-            else:
+        loop = asyncio.get_running_loop()
+        limit = loop.time() + self.response_timeout
+        event = self._placeholder_events.setdefault(key, asyncio.Event())
+        while True:
+            now = loop.time()
+            deadlines = [w for w in waiters if isinstance(w, float)]
+            # 期限切れの枠は応答が失われたとみなして取り除く
+            for deadline in deadlines:
+                if deadline < now:
+                    waiters.remove(deadline)
+            latest = max((d for d in deadlines if d >= now), default=None)
+            if latest is None or now >= limit:
+                return
+            event.clear()
+            try:
+                await asyncio.wait_for(event.wait(), timeout=min(latest, limit) - now)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _send_and_receive(self, frame: bytes) -> Optional[bytes]:
+        serial_port = self.serial
+        if serial_port is None or not serial_port.is_open:
+            logger.error("Serial connection is not open")
+            return None
+
+        key = _response_key(frame)
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[bytes] = loop.create_future()
+        waiters = self._pending.setdefault(key, deque())
+
+        try:
+            # ★ このロックが単一バスの送信の混線を防ぐ
+            async with self.lock:
+                if key[1] == _WRITE_ACK_TYPE:
+                    await self._wait_placeholders(key)
+                waiters.append(future)
+                await loop.run_in_executor(self._io_executor, serial_port.write, frame)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Sent frame: %s", frame.hex(' '))
+
+            return await asyncio.wait_for(future, timeout=self.response_timeout)
+        except asyncio.TimeoutError:
+            logger.error("No response received from motor within timeout")
+            return None
+        except Exception as e:
+            logger.error(f"Error during serial I/O: {e}")
+            return None
+        finally:
+            if future in waiters:
+                waiters.remove(future)
+
+    async def _send_and_receive_many(
+        self, frames: list[bytes]
+    ) -> list[Optional[bytes]]:
+        """複数のフレームを1回の書き込みでまとめて送信し、それぞれの応答を待ちます。"""
+        if not frames:
+            return []
+
+        serial_port = self.serial
+        if serial_port is None or not serial_port.is_open:
+            logger.error("Serial connection is not open")
+            return [None] * len(frames)
+
+        loop = asyncio.get_running_loop()
+        entries: list[
+            tuple[asyncio.Future[bytes], deque[Union[asyncio.Future[bytes], float]]]
+        ] = []
+        for frame in frames:
+            entries.append(
+                (
+                    loop.create_future(),
+                    self._pending.setdefault(_response_key(frame), deque()),
+                )
+            )
+
+        try:
+            # ★ 全フレームの応答待ちを登録してから、連結したフレームを一度に送信する
+            async with self.lock:
+                for key in {_response_key(frame) for frame in frames}:
+                    if key[1] == _WRITE_ACK_TYPE:
+                        await self._wait_placeholders(key)
+                for future, waiters in entries:
+                    waiters.append(future)
+                await loop.run_in_executor(
+                    self._io_executor, serial_port.write, b''.join(frames)
+                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    for frame in frames:
+                        logger.debug("Sent frame: %s", frame.hex(' '))
+
+            futures = [future for future, _ in entries]
+            _, not_done = await asyncio.wait(futures, timeout=self.response_timeout)
+            if not_done:
                 logger.error(
-                    f"Invalid response format received: {response.hex(' ') if response else 'None'}"
+                    f"No response received for {len(not_done)} of {len(frames)} frames within timeout"
                 )
-            return None
+            return [future.result() if future.done() else None for future in futures]
+        except Exception as e:
+            logger.error(f"Error during serial I/O: {e}")
+            return [None] * len(frames)
+        finally:
+            for future, waiters in entries:
+                if future in waiters:
+                    waiters.remove(future)
+
+    def _read_param_frame(self, motor_id: int, index: int) -> bytes:
+        """パラメータ読み込みフレームを生成します。"""
+        return self._create_frame(
+            CommandType.READ_PARAM, motor_id, self.host_id, _READ_PAYLOAD(index)
+        )
 
     async def _read_parameter(self, motor_id: int, index: int) -> Optional[bytes]:
-        payload = struct.pack('<H', index) + b'\x00' * 6
-        frame = self._create_frame(
-            CommandType.READ_PARAM, motor_id, self.host_id, payload
-        )
-        response = await self._send_and_receive(frame)
+        response = await self._send_and_receive(self._read_param_frame(motor_id, index))
         if response:
             return response[11:15]
         return None
@@ -170,11 +446,11 @@ class RobStrideController:
     async def _write_parameter(
         self, motor_id: int, index: int, value: Union[int, float]
     ) -> Optional[bytes]:
-        if isinstance(value, int):
+        if isinstance(value, float):
+            payload = _WRITE_FLT(index, value)
+        elif isinstance(value, int):
             # For RunMode, which is a uint8, pack as a 4-byte integer
-            payload = struct.pack('<H', index) + b'\x00\x00' + struct.pack('<I', value)
-        elif isinstance(value, float):
-            payload = struct.pack('<H', index) + b'\x00\x00' + struct.pack('<f', value)
+            payload = _WRITE_INT(index, value)
         else:
             return None
 
@@ -183,30 +459,135 @@ class RobStrideController:
         )
         return await self._send_and_receive(frame)
 
+    async def _write_parameter_nowait(
+        self, motor_id: int, index: int, value: float
+    ) -> None:
+        """floatパラメータの書き込みフレームを送信のみ行います（応答は受信タスクが読み捨てます）。"""
+        await self._send_only(
+            self._create_frame(
+                CommandType.WRITE_PARAM,
+                motor_id,
+                self.host_id,
+                _WRITE_FLT(index, value),
+            ),
+            (motor_id,),
+        )
+
+    async def _send_only(
+        self, data: Union[bytes, bytearray], motor_ids: Iterable[int]
+    ) -> None:
+        """応答を待たずにパラメータ書き込みフレーム（または連結した複数フレーム）を送信します。
+
+        motor_ids には data に含まれるフレームの宛先を送信順に渡します。
+        """
+        serial_port = self.serial
+        if serial_port is None or not serial_port.is_open:
+            logger.error("Serial connection is not open")
+            return
+
+        # 送信のみのフレームにもタイプ2の応答が返るため、応答待ちの列に読み捨て用の枠を積む。
+        # 枠を積む順序と書き込みの順序は一致するので、後続の応答待ちに古い応答が渡らない
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        deadline = now + self.response_timeout
+        for motor_id in motor_ids:
+            waiters = self._pending.setdefault((motor_id, _WRITE_ACK_TYPE, 0), deque())
+            # 応答が返らず期限切れになった先頭の枠は取り除いておく
+            while waiters and isinstance(waiters[0], float) and waiters[0] < now:
+                waiters.popleft()
+            waiters.append(deadline)
+
+        try:
+            await loop.run_in_executor(self._io_executor, serial_port.write, data)
+        except (serial.SerialException, OSError, RuntimeError) as e:
+            # 書き込みタイムアウトや切断後の送信で制御ループを止めないよう、ログのみ残す
+            logger.error(f"Error during serial I/O: {e}")
+
+    def _enable_low_latency(self) -> None:
+        """USBシリアルのレイテンシタイマーを短縮します（Linuxのみ対応）。"""
+        serial_port = self.serial
+        if serial_port is None:
+            return
+
+        # FTDI系アダプタの既定レイテンシタイマー(16 ms)を ASYNC_LOW_LATENCY で 1 ms にする
+        try:
+            serial_port.set_low_latency_mode(True)
+            logger.info(f"Low latency mode enabled on {self.port}")
+        except (AttributeError, OSError, ValueError) as e:
+            logger.info(f"Low latency mode not available on {self.port}: {e}")
+
+        # ドライバによっては ASYNC_LOW_LATENCY が反映されないため、
+        # ftdi_sio の sysfs 属性があればレイテンシタイマーを直接 1 ms に設定する
+        device = os.path.basename(os.path.realpath(self.port))
+        latency_timer = f"/sys/bus/usb-serial/devices/{device}/latency_timer"
+        if os.path.exists(latency_timer):
+            try:
+                with open(latency_timer, 'w') as f:
+                    f.write('1')
+                logger.info(f"Latency timer set to 1 ms on {self.port}")
+            except OSError as e:
+                logger.info(f"Latency timer not writable on {self.port}: {e}")
+
+    def _enlarge_buffers(self) -> None:
+        """ドライバの送受信バッファを拡張します（Windowsのみ対応）。"""
+        serial_port = self.serial
+        if serial_port is None:
+            return
+
+        # 連続送信時に複数の応答がまとめて届いても取りこぼさないようにする
+        try:
+            serial_port.set_buffer_size(rx_size=65536, tx_size=65536)
+            logger.info(f"Serial buffers enlarged on {self.port}")
+        except (AttributeError, OSError, ValueError) as e:
+            logger.info(f"Serial buffer size not adjustable on {self.port}: {e}")
+
+    async def _probe(self, motor_id: int) -> bool:
+        """デバイスID取得コマンドでモーターとの疎通を確認します。"""
+        frame = self._create_frame(CommandType.GET_DEVICE_ID, motor_id)
+        if await self._send_and_receive(frame):
+            logger.info(f"Connection established successfully with motor ID {motor_id}")
+            return True
+        logger.error(f"Failed to establish connection with motor ID {motor_id}")
+        return False
+
     async def connect(self) -> bool:
         logger.info("Initiating connection to motors")
+        self._io_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"robstride-io-{self.port}"
+        )
+        self._rx_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"robstride-rx-{self.port}"
+        )
         try:
-            # Create serial connection with asyncio
-            coro = serial_asyncio.open_serial_connection(
-                url=self.port, baudrate=self.baudrate, timeout=1.0
+            # Open the serial port on the dedicated I/O thread
+            # (serial_for_url により "loop://" や "rfc2217://" などの URL も指定できる)
+            self.serial = await asyncio.get_running_loop().run_in_executor(
+                self._io_executor,
+                partial(
+                    serial.serial_for_url,
+                    self.port,
+                    self.baudrate,
+                    timeout=1.0,
+                    # 送信が詰まった場合に I/O スレッドが無期限に止まらないようにする
+                    write_timeout=self.write_timeout,
+                ),
             )
-            self.reader, self.writer = await coro
             logger.info(f"Serial port {self.port} opened successfully")
         except Exception as e:
             logger.error(f"Failed to open serial port {self.port}: {e}")
+            await self.disconnect()
             return False
 
-        # Check connection to all motors
-        all_connected = True
-        for motor_id in self.motors.keys():
-            frame = self._create_frame(CommandType.GET_DEVICE_ID, motor_id)
-            if await self._send_and_receive(frame):
-                logger.info(
-                    f"Connection established successfully with motor ID {motor_id}"
-                )
-            else:
-                logger.error(f"Failed to establish connection with motor ID {motor_id}")
-                all_connected = False
+        self._enable_low_latency()
+        self._enlarge_buffers()
+        self._rxbuf.clear()
+        self._reader_task = asyncio.create_task(self._reader_loop())
+
+        # Check connection to all motors concurrently
+        results = await asyncio.gather(
+            *(self._probe(motor_id) for motor_id in self.motors)
+        )
+        all_connected = all(results)
 
         if all_connected:
             logger.info("All motors connected successfully")
@@ -228,21 +609,29 @@ class RobStrideController:
             logger.error(f"Failed to send enable command to motor {motor_id}")
             return False
 
-        can_id_29bit = int.from_bytes(response[2:6], 'big') >> 3
-        status_val = (can_id_29bit >> 22) & 0b11
-        status = (
-            MotorStatus(status_val)
-            if status_val in [m.value for m in MotorStatus]
-            else MotorStatus.UNKNOWN
-        )
+        # フィードバックフレームのデータエリア2: bit15-14 がモード状態, bit13-8 が故障情報
+        _, data_area2, _ = _decode_can_id(response)
+        status = _STATUS_TABLE[data_area2 >> 14]
 
-        if status == MotorStatus.RUN:
+        if status is MotorStatus.RUN:
             logger.info(f"Motor {motor_id} enabled successfully and entered RUN state")
             self.motors[motor_id]._set_enabled(True)
+            self._pos_targets[motor_id] = (
+                bytearray(
+                    self._create_frame(
+                        CommandType.WRITE_PARAM,
+                        motor_id,
+                        self.host_id,
+                        _WRITE_FLT(_IDX_LOC_REF, 0.0),
+                    )
+                ),
+                self.motors[motor_id].offset,
+            )
             return True
         else:
+            fault_bits = (data_area2 >> 8) & 0x3F
             logger.error(
-                f"Motor {motor_id} enable failed: Invalid status {status.name}"
+                f"Motor {motor_id} enable failed: Invalid status {status.name} (fault bits: 0x{fault_bits:02x})"
             )
             return False
 
@@ -255,9 +644,71 @@ class RobStrideController:
         logger.info(f"Disabling motor {motor_id}")
         frame = self._create_frame(CommandType.DISABLE, motor_id)
         await self._send_and_receive(frame)
+        self._clear_motor_state(motor_id)
+        logger.info(f"Disable command sent successfully to motor {motor_id}")
+
+    def _clear_motor_state(self, motor_id: int) -> None:
+        """無効化したモーターの有効状態・モード・送信バッファを破棄します。"""
         self.motors[motor_id]._set_enabled(False)
         self.motors[motor_id]._set_mode(None)
-        logger.info(f"Disable command sent successfully to motor {motor_id}")
+        self._pos_targets.pop(motor_id, None)
+        self._last_command_times.pop(motor_id, None)
+        self._cancel_deferred_velocity(motor_id)
+
+    def _cancel_deferred_velocity(self, motor_id: int) -> None:
+        """保留中の目標速度を破棄します。"""
+        self._deferred_velocities.pop(motor_id, None)
+        task = self._deferred_tasks.pop(motor_id, None)
+        if task is not None:
+            task.cancel()
+
+    def _is_rate_limited(self, motor_id: int, velocity: float) -> bool:
+        """最小送信間隔に満たない指令かどうかを判定し、送信する場合は時刻を記録します。
+
+        間隔に満たない指令は破棄せずに保留し、間隔の経過後に最新の値を送信します。
+        """
+        limits = self.motors[motor_id].limits
+        if limits is None or limits.min_command_period_s is None:
+            return False
+
+        now = time.monotonic()
+        last = self._last_command_times.get(motor_id)
+        # 停止指令 (0.0) は遅らせるとモーターが回り続けるため、間隔に関わらず即座に送信する
+        if (
+            velocity != 0.0
+            and last is not None
+            and now - last < limits.min_command_period_s
+        ):
+            # ファームウェアの制御周期を超える指令は取りこぼされるため、最新の値のみ後で送信する
+            self._deferred_velocities[motor_id] = velocity
+            if motor_id not in self._deferred_tasks:
+                self._deferred_tasks[motor_id] = asyncio.create_task(
+                    self._send_deferred_velocity(
+                        motor_id, last + limits.min_command_period_s - now
+                    )
+                )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Command to motor %d deferred by rate limit", motor_id)
+            return True
+
+        # 即座に送信する指令は保留中の古い値より新しいため、保留中の値は送信しない
+        self._cancel_deferred_velocity(motor_id)
+        self._last_command_times[motor_id] = now
+        return False
+
+    async def _send_deferred_velocity(self, motor_id: int, delay: float) -> None:
+        """送信間隔の経過を待ち、保留中の最新の目標速度を送信します。"""
+        await asyncio.sleep(delay)
+        del self._deferred_tasks[motor_id]
+        velocity = self._deferred_velocities.pop(motor_id)
+        self._last_command_times[motor_id] = time.monotonic()
+        await self._write_parameter_nowait(motor_id, _IDX_SPD_REF, velocity)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Deferred target velocity %.2f rad/s sent to motor %d",
+                velocity,
+                motor_id,
+            )
 
     def _check_motor_enabled(self, motor_id: int) -> bool:
         """モーターが有効かどうかをチェック"""
@@ -288,23 +739,40 @@ class RobStrideController:
         return True
 
     async def _set_run_mode(self, motor_id: int, mode: RunMode) -> bool:
-        logger.info(f"Setting motor {motor_id} to {mode.name} mode")
-        await self._write_parameter(motor_id, ParameterIndex.RUN_MODE.value, mode.value)
+        if motor_id not in self.motors:
+            logger.error(f"Motor ID {motor_id} not found in motor list")
+            return False
 
-        await asyncio.sleep(0.1)
-        read_data = await self._read_parameter(motor_id, ParameterIndex.RUN_MODE.value)
-        if read_data:
-            current_mode = int.from_bytes(read_data[0:1], 'little')
+        logger.info(f"Setting motor {motor_id} to {mode.name} mode")
+        # 書き込みと1回目の読み戻しを続けて送信する（モーターは受信順に処理する）
+        _, response = await self._send_and_receive_many(
+            [
+                self._runmode_frames[(motor_id, mode)],
+                self._read_param_frame(motor_id, ParameterIndex.RUN_MODE.value),
+            ]
+        )
+        read_data = response[11:15] if response else None
+
+        current_mode = None
+        for delay in (*_VERIFY_DELAYS, None):
+            if not read_data:
+                logger.error(f"Failed to read run_mode parameter for motor {motor_id}")
+                return False
+            current_mode = read_data[0]
             if current_mode == mode.value:
                 logger.info(f"Motor {motor_id} {mode.name} mode set successfully")
                 self.motors[motor_id]._set_mode(mode)
                 return True
-            else:
-                logger.error(
-                    f"Motor {motor_id} {mode.name} mode setting failed: Unexpected run_mode value {current_mode}"
-                )
-        else:
-            logger.error(f"Failed to read run_mode parameter for motor {motor_id}")
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+            read_data = await self._read_parameter(
+                motor_id, ParameterIndex.RUN_MODE.value
+            )
+
+        logger.error(
+            f"Motor {motor_id} {mode.name} mode setting failed: Unexpected run_mode value {current_mode}"
+        )
         return False
 
     async def _set_float_parameter(
@@ -319,25 +787,85 @@ class RobStrideController:
             logger.error(f"Motor ID {motor_id} not found in motor list")
             return False
 
-        logger.info(f"Setting {name} to {value} {unit} for motor {motor_id}")
-        await self._write_parameter(motor_id, param_index.value, value)
+        return await self._set_float_parameters(
+            motor_id, [(param_index, value, name, unit)]
+        )
 
-        await asyncio.sleep(0.1)
-        read_data = await self._read_parameter(motor_id, param_index.value)
-        if read_data:
-            current_val = struct.unpack('<f', read_data)[0]
-            if math.isclose(current_val, value, rel_tol=1e-6):
+    async def _set_float_parameters(
+        self,
+        motor_id: int,
+        params: list[tuple[ParameterIndex, float, str, str]],
+    ) -> bool:
+        """複数のfloatパラメータを続けて書き込み、読み戻し確認をまとめて行います。"""
+        if not params:
+            # 現在のモードに該当するリミットが設定されていなければ何もしない
+            return True
+
+        for _, value, name, unit in params:
+            logger.info(f"Setting {name} to {value} {unit} for motor {motor_id}")
+        # 全パラメータの書き込みと1回目の読み戻しを1回でまとめて送信する。
+        # モーターは受信順に処理するため、読み戻しには書き込み後の値が返る
+        responses = await self._send_and_receive_many(
+            [
+                self._create_frame(
+                    CommandType.WRITE_PARAM,
+                    motor_id,
+                    self.host_id,
+                    _WRITE_FLT(param_index.value, value),
+                )
+                for param_index, value, _, _ in params
+            ]
+            + [
+                self._read_param_frame(motor_id, param_index.value)
+                for param_index, _, _, _ in params
+            ]
+        )
+        read_results = [
+            response[11:15] if response else None
+            for response in responses[len(params) :]
+        ]
+
+        remaining = params
+        current_vals: list[float] = []
+        for delay in (*_VERIFY_DELAYS, None):
+            unconfirmed = []
+            current_vals = []
+            for param, read_data in zip(remaining, read_results):
+                _, value, name, unit = param
+                if not read_data:
+                    logger.error(
+                        f"Failed to read {name} parameter for motor {motor_id}"
+                    )
+                    return False
+                if read_data == _PACK_F(value):
+                    # 書き込んだバイト列がそのまま読み戻せれば数値比較は不要
+                    current_val = value
+                else:
+                    current_val = _UNPACK_F(read_data)[0]
+                    if not math.isclose(current_val, value, rel_tol=1e-6):
+                        unconfirmed.append(param)
+                        current_vals.append(current_val)
+                        continue
                 logger.info(
                     f"Motor {motor_id} {name} set successfully to {current_val:.2f} {unit}"
                 )
-                return True
-            else:
-                logger.error(
-                    f"Motor {motor_id} {name} setting failed: Expected {value:.2f}, got {current_val:.2f} {unit}"
+            remaining = unconfirmed
+            if not remaining or delay is None:
+                break
+            # 反映が確認できないパラメータのみ、待機してから読み戻しを再送する
+            await asyncio.sleep(delay)
+            read_results = await asyncio.gather(
+                *(
+                    self._read_parameter(motor_id, param_index.value)
+                    for param_index, _, _, _ in remaining
                 )
-        else:
-            logger.error(f"Failed to read {name} parameter for motor {motor_id}")
-        return False
+            )
+
+        for (_, value, name, unit), current_val in zip(remaining, current_vals):
+            logger.error(
+                f"Motor {motor_id} {name} setting failed: Expected {value:.2f}, got {current_val:.2f} {unit}"
+            )
+        return not remaining
 
     # --- PP (Profile Position) Mode Methods ---
     async def set_mode_pp(self, motor_id: int) -> bool:
@@ -353,52 +881,86 @@ class RobStrideController:
             logger.warning(f"No limits configured for motor {motor_id}")
             return True
 
-        success = True
+        # 設定されているリミットを一括で書き込み、読み戻し確認もまとめて行う
+        params: list[tuple[ParameterIndex, float, str, str]] = []
         limits = motor.limits
 
         if limits.pp_vel_max is not None:
-            success &= await self._set_float_parameter(
-                motor_id,
-                ParameterIndex.VEL_MAX,
-                limits.pp_vel_max,
-                "PP velocity",
-                "rad/s",
+            params.append(
+                (ParameterIndex.VEL_MAX, limits.pp_vel_max, "PP velocity", "rad/s")
             )
 
         if limits.pp_acc_set is not None:
-            success &= await self._set_float_parameter(
-                motor_id,
-                ParameterIndex.ACC_SET,
-                limits.pp_acc_set,
-                "PP acceleration",
-                "rad/s^2",
+            params.append(
+                (
+                    ParameterIndex.ACC_SET,
+                    limits.pp_acc_set,
+                    "PP acceleration",
+                    "rad/s^2",
+                )
             )
 
         if limits.pp_limit_cur is not None:
-            success &= await self._set_float_parameter(
-                motor_id,
-                ParameterIndex.LIMIT_CUR,
-                limits.pp_limit_cur,
-                "PP current limit",
-                "A",
+            params.append(
+                (ParameterIndex.LIMIT_CUR, limits.pp_limit_cur, "PP current limit", "A")
             )
 
-        return success
+        return await self._set_float_parameters(motor_id, params)
 
     async def set_target_position(self, motor_id: int, position_rad: float) -> None:
         if motor_id not in self.motors:
             logger.error(f"Motor ID {motor_id} not found in motor list")
             return
 
-        logger.info(
-            f"Setting target position to {position_rad:.2f} rad for motor {motor_id}"
-        )
-        await self._write_parameter(
+        await self._write_parameter_nowait(
             motor_id,
-            ParameterIndex.LOC_REF.value,
+            _IDX_LOC_REF,
             position_rad + self.motors[motor_id].offset,
         )
-        logger.info(f"Target position command sent successfully to motor {motor_id}")
+        # 高頻度で呼ばれるため、DEBUG 無効時はログ文字列を組み立てない
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Target position %.2f rad sent to motor %d", position_rad, motor_id
+            )
+
+    async def set_target_position_fast(
+        self, motor_id: int, position_rad: float
+    ) -> None:
+        """有効化済みモーターへ目標位置を応答を待たずに送信します（CSPの高頻度指令向け）。"""
+        target = self._pos_targets.get(motor_id)
+        if target is None:
+            logger.error(
+                f"Motor {motor_id} is not enabled. Please enable the motor first."
+            )
+            return
+
+        # 送信バッファの値部分 (11-14バイト目) のみを書き換えて再利用する。
+        # 同一モーターへの同時呼び出しでは最新の値が送信される
+        frame, offset = target
+        _FLOAT_PACK_INTO(frame, 11, position_rad + offset)
+        await self._send_only(frame, (motor_id,))
+
+    async def set_target_positions_fast(self, targets: dict[int, float]) -> None:
+        """複数モーターの目標位置を1回の書き込みでまとめて送信します（応答は待ちません）。
+
+        未有効化のモーターが1台でも含まれる場合は、いずれの目標位置も送信しません。
+        """
+        # 送信バッファを書き換える前に全モーターを確認し、未送信の値を残さない
+        for motor_id in targets:
+            if motor_id not in self._pos_targets:
+                logger.error(
+                    f"Motor {motor_id} is not enabled. Please enable the motor first."
+                )
+                return
+
+        frames = []
+        for motor_id, position_rad in targets.items():
+            frame, offset = self._pos_targets[motor_id]
+            _FLOAT_PACK_INTO(frame, 11, position_rad + offset)
+            frames.append(frame)
+
+        # 全フレームを連結し、1回のシステムコールで送信する
+        await self._send_only(b''.join(frames), targets)
 
     # --- Velocity Mode Methods ---
     async def set_mode_velocity(self, motor_id: int) -> bool:
@@ -414,40 +976,79 @@ class RobStrideController:
             logger.warning(f"No limits configured for motor {motor_id}")
             return True
 
-        success = True
+        # 設定されているリミットを一括で書き込み、読み戻し確認もまとめて行う
+        params: list[tuple[ParameterIndex, float, str, str]] = []
         limits = motor.limits
 
         if limits.velocity_limit_cur is not None:
-            success &= await self._set_float_parameter(
-                motor_id,
-                ParameterIndex.LIMIT_CUR,
-                limits.velocity_limit_cur,
-                "Velocity current limit",
-                "A",
+            params.append(
+                (
+                    ParameterIndex.LIMIT_CUR,
+                    limits.velocity_limit_cur,
+                    "Velocity current limit",
+                    "A",
+                )
             )
 
         if limits.velocity_acc_rad is not None:
-            success &= await self._set_float_parameter(
-                motor_id,
-                ParameterIndex.ACC_RAD,
-                limits.velocity_acc_rad,
-                "Velocity acceleration",
-                "rad/s^2",
+            params.append(
+                (
+                    ParameterIndex.ACC_RAD,
+                    limits.velocity_acc_rad,
+                    "Velocity acceleration",
+                    "rad/s^2",
+                )
             )
 
-        return success
+        return await self._set_float_parameters(motor_id, params)
 
     async def set_target_velocity(self, motor_id: int, velocity: float) -> None:
         """速度制御モードで目標速度を設定します。"""
         if motor_id not in self.motors:
             logger.error(f"Motor ID {motor_id} not found in motor list")
             return
+        if self._is_rate_limited(motor_id, velocity):
+            return
 
-        logger.info(
-            f"Setting target velocity to {velocity:.2f} rad/s for motor {motor_id}"
-        )
-        await self._write_parameter(motor_id, ParameterIndex.SPD_REF.value, velocity)
-        logger.info(f"Target velocity command sent successfully to motor {motor_id}")
+        await self._write_parameter_nowait(motor_id, _IDX_SPD_REF, velocity)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Target velocity %.2f rad/s sent to motor %d", velocity, motor_id
+            )
+
+    async def set_target_velocities(self, targets: dict[int, float]) -> None:
+        """複数モーターの目標速度を1回の書き込みでまとめて送信します（応答は待ちません）。
+
+        未登録のモーターIDが1つでも含まれる場合は、いずれの目標速度も送信しません。
+        """
+        # フレームを組み立てる前に全モーターIDを確認する
+        for motor_id in targets:
+            if motor_id not in self.motors:
+                logger.error(f"Motor ID {motor_id} not found in motor list")
+                return
+
+        frames = []
+        sent_ids = []
+        for motor_id, velocity in targets.items():
+            if self._is_rate_limited(motor_id, velocity):
+                continue
+            sent_ids.append(motor_id)
+            frames.append(
+                self._create_frame(
+                    CommandType.WRITE_PARAM,
+                    motor_id,
+                    self.host_id,
+                    _WRITE_FLT(_IDX_SPD_REF, velocity),
+                )
+            )
+
+        if not frames:
+            return
+
+        # 全フレームを連結し、1回のシステムコールで送信する
+        await self._send_only(b''.join(frames), sent_ids)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Target velocities sent: %s", targets)
 
     # --- Current Mode Methods ---
     async def set_mode_current(self, motor_id: int) -> bool:
@@ -458,9 +1059,9 @@ class RobStrideController:
             logger.error(f"Motor ID {motor_id} not found in motor list")
             return
 
-        logger.info(f"Setting target current to {current:.2f} A for motor {motor_id}")
-        await self._write_parameter(motor_id, ParameterIndex.IQ_REF.value, current)
-        logger.info(f"Target current command sent successfully to motor {motor_id}")
+        await self._write_parameter_nowait(motor_id, _IDX_IQ_REF, current)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Target current %.2f A sent to motor %d", current, motor_id)
 
     # --- CSP (Cyclic Synchronous Position) Mode Methods ---
     async def set_mode_csp(self, motor_id: int) -> bool:
@@ -476,34 +1077,58 @@ class RobStrideController:
             logger.warning(f"No limits configured for motor {motor_id}")
             return True
 
-        success = True
+        # 設定されているリミットを一括で書き込み、読み戻し確認もまとめて行う
+        params: list[tuple[ParameterIndex, float, str, str]] = []
         limits = motor.limits
 
         if limits.csp_limit_spd is not None:
-            success &= await self._set_float_parameter(
-                motor_id,
-                ParameterIndex.LIMIT_SPD,
-                limits.csp_limit_spd,
-                "CSP velocity limit",
-                "rad/s",
+            params.append(
+                (
+                    ParameterIndex.LIMIT_SPD,
+                    limits.csp_limit_spd,
+                    "CSP velocity limit",
+                    "rad/s",
+                )
             )
 
         if limits.csp_limit_cur is not None:
-            success &= await self._set_float_parameter(
-                motor_id,
-                ParameterIndex.LIMIT_CUR,
-                limits.csp_limit_cur,
-                "CSP current limit",
-                "A",
+            params.append(
+                (
+                    ParameterIndex.LIMIT_CUR,
+                    limits.csp_limit_cur,
+                    "CSP current limit",
+                    "A",
+                )
             )
 
-        return success
+        return await self._set_float_parameters(motor_id, params)
 
     async def disconnect(self) -> None:
-        if self.writer and not self.writer.is_closing():
-            self.writer.close()
-            await self.writer.wait_closed()
+        loop = asyncio.get_running_loop()
+        for motor_id in list(self._deferred_tasks):
+            self._cancel_deferred_velocity(motor_id)
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            if self.serial is not None:
+                # 受信スレッドの読み込み待ちを解除する (未対応のポート種別ではタイムアウトを待つ)
+                try:
+                    self.serial.cancel_read()
+                except (AttributeError, NotImplementedError, OSError) as e:
+                    logger.info(f"cancel_read not available on {self.port}: {e}")
+            await asyncio.gather(self._reader_task, return_exceptions=True)
+            self._reader_task = None
+            # 受信スレッドの読み込みが終わるのを待ってからポートを閉じる
+            await loop.run_in_executor(self._rx_executor, lambda: None)
+        if self.serial is not None and self.serial.is_open:
+            await loop.run_in_executor(self._io_executor, self.serial.close)
             logger.info("Serial port closed")
+        # 二重に呼ばれても何もしないよう、閉じたポートへの参照を破棄する
+        self.serial = None
+        for executor in (self._io_executor, self._rx_executor):
+            if executor is not None:
+                executor.shutdown(wait=False)
+        self._io_executor = None
+        self._rx_executor = None
 
     async def __aenter__(self) -> 'RobStrideController':
         """async with構文の開始時に接続を行います。"""
@@ -514,18 +1139,37 @@ class RobStrideController:
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """async with構文の終了時に、安全にモーターを停止し、切断します。"""
-        if self.writer and not self.writer.is_closing():
-            logger.info(f"Safely shutting down motors on {self.port} sequentially...")
+        if self._is_open():
+            logger.info(f"Safely shutting down motors on {self.port}...")
 
-            # ★安全な逐次実行（forループ）
+            # ★全モーターの速度・電流指令のゼロ化を、モーター順に並べて1回で送信
+            zero_frames = []
             for motor_id in self.motors.keys():
-                await self.set_target_velocity(motor_id, 0.0)
-                await self.set_target_current(motor_id, 0.0)
+                # 保留中の目標速度がゼロ化の後に送信されないよう破棄する
+                self._cancel_deferred_velocity(motor_id)
+                for param_index in (ParameterIndex.SPD_REF, ParameterIndex.IQ_REF):
+                    zero_frames.append(
+                        self._create_frame(
+                            CommandType.WRITE_PARAM,
+                            motor_id,
+                            self.host_id,
+                            _WRITE_FLT(param_index.value, 0.0),
+                        )
+                    )
+            await self._send_and_receive_many(zero_frames)
 
             await asyncio.sleep(0.1)
 
+            # 無効化コマンドも同様にまとめて送信する
+            await self._send_and_receive_many(
+                [
+                    self._create_frame(CommandType.DISABLE, motor_id)
+                    for motor_id in self.motors.keys()
+                ]
+            )
             for motor_id in self.motors.keys():
-                await self.disable(motor_id)
+                self._clear_motor_state(motor_id)
+            logger.info(f"Disable commands sent to all motors on {self.port}")
 
         await self.disconnect()
 
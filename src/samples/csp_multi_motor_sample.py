@@ -1,32 +1,37 @@
+import asyncio
 import math
-import time
 
-from src.robstride import RobStride, RobStrideController
+from src.robstride import RobStride, RobStrideController, RobStrideLimits
 
 # --- 設定項目 ---
 SERIAL_PORT = "COM6"  # ご自身の環境に合わせてCOMポート名を指定してください
 
+# モーター制限設定
+MOTOR_LIMITS = RobStrideLimits(
+    csp_limit_spd=1.0,  # CSP速度制限 [rad/s]
+)
+
 # 3つのモーターの設定
 MOTORS = [
-    RobStride(id=4, max_pos=2 * math.pi, min_pos=0.0, max_speed=1.0, offset=0.0),
-    RobStride(id=5, max_pos=2 * math.pi, min_pos=0.0, max_speed=1.0, offset=0.0),
-    RobStride(id=6, max_pos=2 * math.pi, min_pos=0.0, max_speed=1.0, offset=0.0),
+    RobStride(id=4, offset=0.0, limits=MOTOR_LIMITS),
+    RobStride(id=5, offset=0.0, limits=MOTOR_LIMITS),
+    RobStride(id=6, offset=0.0, limits=MOTOR_LIMITS),
 ]
 
 
-def main() -> None:
+async def main() -> None:
     """
     3つのRobStrideモーターをCSPモードで同時制御するメイン関数。
     """
     print("--- RobStride CSPモード 3軸同時制御サンプル ---")
 
     try:
-        with RobStrideController(port=SERIAL_PORT, motors=MOTORS) as controller:
+        async with RobStrideController(port=SERIAL_PORT, motors=MOTORS) as controller:
 
             # --- ステップ1: 全モーターをDisable状態でCSPモードに設定 ---
             print("\n🔧 全モーターをCSPモードに設定中...")
             for motor in MOTORS:
-                if not controller.set_mode_csp(motor.id):
+                if not await controller.set_mode_csp(motor.id):
                     print(f"エラー: モーター{motor.id}のCSPモード設定に失敗しました。")
                     return
                 print(f"  ✅ モーター{motor.id}: CSPモード設定完了")
@@ -34,23 +39,18 @@ def main() -> None:
             # --- ステップ2: 全モーターを有効化 ---
             print("\n⚡ 全モーターを有効化中...")
             for motor in MOTORS:
-                if not controller.enable(motor.id):
+                if not await controller.enable(motor.id):
                     print(f"エラー: モーター{motor.id}の有効化に失敗しました。")
                     return
                 print(f"  ✅ モーター{motor.id}: 有効化完了")
 
-            time.sleep(0.5)
-
-            # --- ステップ3: 各モーターの速度制限を設定 ---
-            print("\n⚙️ 速度制限を設定中...")
-            velocity_limits = [1.0, 1.0, 1.0]  # 各モーターの速度制限 [rad/s]
-            for i, motor in enumerate(MOTORS):
-                if not controller.set_csp_velocity_limit(motor.id, velocity_limits[i]):
-                    print(f"エラー: モーター{motor.id}の速度制限設定に失敗しました。")
+            # --- ステップ3: CSP制限パラメータを適用 ---
+            print("\n⚙️ CSP制限パラメータを設定中...")
+            for motor in MOTORS:
+                if not await controller.apply_csp_limits(motor.id):
+                    print(f"エラー: モーター{motor.id}のCSP制限設定に失敗しました。")
                     return
-                print(
-                    f"  ✅ モーター{motor.id}: 速度制限 {velocity_limits[i]:.1f} rad/s"
-                )
+                print(f"  ✅ モーター{motor.id}: CSP制限適用完了")
 
             # --- ステップ4: 同期された位置制御を実行 ---
             print("\n🎯 同期位置制御を開始します...")
@@ -58,26 +58,26 @@ def main() -> None:
             # パターン4: 原点復帰
             print("\n📍 パターン4: 全モーター原点復帰")
             for motor in MOTORS:
-                controller.set_target_position(motor.id, 0.0)
+                await controller.set_target_position(motor.id, 0.0)
                 print(f"  -> モーター{motor.id}: 目標位置 0.00 rad")
-            time.sleep(3)
+            await asyncio.sleep(3)
 
             # パターン1: 全モーターを45度に移動
             print("\n📍 パターン1: 全モーターを45度 (π/4 rad) に移動")
             target_positions = [-math.pi / 4, -math.pi / 4, -math.pi / 4]
             for i, motor in enumerate(MOTORS):
-                controller.set_target_position(motor.id, target_positions[i])
+                await controller.set_target_position(motor.id, target_positions[i])
                 print(
                     f"  -> モーター{motor.id}: 目標位置 {target_positions[i]:.2f} rad"
                 )
-            time.sleep(4)
+            await asyncio.sleep(4)
 
             # パターン4: 原点復帰
             print("\n📍 パターン4: 全モーター原点復帰")
             for motor in MOTORS:
-                controller.set_target_position(motor.id, 0.0)
+                await controller.set_target_position(motor.id, 0.0)
                 print(f"  -> モーター{motor.id}: 目標位置 0.00 rad")
-            time.sleep(3)
+            await asyncio.sleep(3)
 
             print("\n✅ 全ての動作パターンが正常に完了しました。")
 
@@ -86,5 +86,5 @@ def main() -> None:
 
 
 if __name__ == '__main__':
-    main()
+    asyncio.run(main())
 # 実行コマンド: python -m src.samples.csp_multi_motor_sample
@@ -45,8 +45,6 @@ async def main() -> None:
                     return
                 print(f"  ✅ モーター{motor.id}: 有効化完了")
 
-            await asyncio.sleep(0.5)
-
             # --- ステップ3: CSP制限パラメータを適用 ---
             print("\n⚙️ CSP制限パラメータを設定中...")
             for motor in MOTORS:
@@ -89,41 +87,39 @@ async def main() -> None:
             period = 1.0 / frequency  # 周期
             amplitude = math.pi * 3  # 振幅（±180度）
             sine_frequency = 0.1  # 正弦波の周波数（0.1Hz）
-
-            start_time = asyncio.get_event_loop().time()
-            last_send_time = start_time
+            omega = 2 * math.pi * sine_frequency  # 角周波数 [rad/s]（ループ外で計算）
+
+            # 各送信時刻の目標位置を事前に計算しておく（ループ内で正弦を計算しない）。
+            # 送信が遅れた周期も予定時刻の値を送るが、ずれはその周期の遅れ分に限られ蓄積しない
+            num_ticks = int(duration * frequency)
+            target_table = [
+                amplitude * math.sin(omega * tick * period) for tick in range(num_ticks)
+            ]
+            ticks_per_report = max(1, round(frequency / 2))  # 進捗表示の間隔（0.5秒）
+            # ループ内で毎回参照しないよう、モーターIDと送信メソッドを保持しておく
+            motor_ids = [motor.id for motor in MOTORS]
+            send_targets = controller.set_target_positions_fast
 
             print(f"  -> 送信頻度: {frequency}Hz, 持続時間: {duration}秒")
             print(
                 f"  -> 正弦波振幅: {math.degrees(amplitude):.1f}度, 周波数: {sine_frequency}Hz"
             )
 
-            while (asyncio.get_event_loop().time() - start_time) < duration:
-                current_time = asyncio.get_event_loop().time()
+            loop = asyncio.get_running_loop()
+            start_time = loop.time()
 
-                # 90Hzの周期でコマンドを送信
-                if (current_time - last_send_time) >= period:
-                    elapsed = current_time - start_time
-
-                    # 正弦波の目標位置を計算
-                    target_position = amplitude * math.sin(
-                        2 * math.pi * sine_frequency * elapsed
-                    )
+            for tick, target_position in enumerate(target_table):
+                # 次の送信時刻まで待機（送信時刻は開始時刻から算出し、ずれを蓄積させない）
+                await asyncio.sleep(max(0.0, start_time + tick * period - loop.time()))
 
-                    # 全モーターに同じ目標位置を設定
-                    for motor in MOTORS:
-                        await controller.set_target_position(motor.id, target_position)
+                # 全モーターに同じ目標位置を設定（1回の書き込みでまとめて送信）
+                await send_targets(dict.fromkeys(motor_ids, target_position))
 
-                    # 進捗表示（0.5秒ごと）
-                    if int(elapsed * 2) != int((elapsed - period) * 2):
-                        print(
-                            f"    時刻: {elapsed:.1f}s, 目標位置: {math.degrees(target_position):+6.1f}度"
-                        )
-
-                    last_send_time = current_time
-
-                # CPUを少し休ませる
-                await asyncio.sleep(0.001)
+                # 進捗表示（0.5秒ごと）
+                if tick % ticks_per_report == 0:
+                    print(
+                        f"    時刻: {tick * period:.1f}s, 目標位置: {math.degrees(target_position):+6.1f}度"
+                    )
 
             # 最終的に原点に戻す
             print("  -> 原点復帰中...")
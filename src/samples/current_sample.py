@@ -40,8 +40,6 @@ async def main() -> None:
                     return
                 print(f"  ✅ モーター{motor.id}: 有効化完了")
 
-            await asyncio.sleep(0.5)
-
             # --- ステップ3: Current制御モードでは特別な制限設定は不要 ---
             print("\n⚙️ Current制御モードでは特別な制限設定は不要です")
             print("   Current制御では、set_target_current()で直接電流値を指定します")
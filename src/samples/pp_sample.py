@@ -46,8 +46,6 @@ async def main() -> None:
                     return
                 print(f"  ✅ モーター{motor.id}: 有効化完了")
 
-            await asyncio.sleep(0.5)
-
             # --- ステップ3: PP制限パラメータを適用 ---
             print("\n⚙️ PP制限パラメータを設定中...")
             for motor in MOTORS:
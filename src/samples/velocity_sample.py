@@ -30,8 +30,12 @@ async def main() -> None:
 
             # --- ステップ1: 全モーターをDisable状態でVelocity制御モードに設定 ---
             print("\n🔧 全モーターをVelocity制御モードに設定中...")
-            for motor in MOTORS:
-                if not await controller.set_mode_velocity(motor.id):
+            # 全モーターへの設定を並行して行う（応答はモーターIDごとに振り分けられる）
+            results = await asyncio.gather(
+                *(controller.set_mode_velocity(motor.id) for motor in MOTORS)
+            )
+            for motor, ok in zip(MOTORS, results):
+                if not ok:
                     print(
                         f"エラー: モーター{motor.id}のVelocity制御モード設定に失敗しました。"
                     )
@@ -40,18 +44,22 @@ async def main() -> None:
 
             # --- ステップ2: 全モーターを有効化 ---
             print("\n⚡ 全モーターを有効化中...")
-            for motor in MOTORS:
-                if not await controller.enable(motor.id):
+            results = await asyncio.gather(
+                *(controller.enable(motor.id) for motor in MOTORS)
+            )
+            for motor, ok in zip(MOTORS, results):
+                if not ok:
                     print(f"エラー: モーター{motor.id}の有効化に失敗しました。")
                     return
                 print(f"  ✅ モーター{motor.id}: 有効化完了")
 
-            await asyncio.sleep(0.5)
-
             # --- ステップ3: Velocity制限パラメータを適用 ---
             print("\n⚙️ Velocity制限パラメータを設定中...")
-            for motor in MOTORS:
-                if not await controller.apply_velocity_limits(motor.id):
+            results = await asyncio.gather(
+                *(controller.apply_velocity_limits(motor.id) for motor in MOTORS)
+            )
+            for motor, ok in zip(MOTORS, results):
+                if not ok:
                     print(
                         f"エラー: モーター{motor.id}のVelocity制限設定に失敗しました。"
                     )
@@ -64,31 +72,37 @@ async def main() -> None:
             # パターン1: 正方向回転
             print("\n📍 パターン1: 正方向回転 (0.5 rad/s)")
             target_velocity = 15.7
+            await controller.set_target_velocities(
+                {motor.id: target_velocity for motor in MOTORS}
+            )
             for motor in MOTORS:
-                await controller.set_target_velocity(motor.id, target_velocity)
                 print(f"  -> モーター{motor.id}: 目標速度 {target_velocity:.1f} rad/s")
             await asyncio.sleep(3)
 
             # パターン2: 停止
             print("\n📍 パターン2: 停止 (0.0 rad/s)")
             target_velocity = 0.0
+            await controller.set_target_velocities(
+                {motor.id: target_velocity for motor in MOTORS}
+            )
             for motor in MOTORS:
-                await controller.set_target_velocity(motor.id, target_velocity)
                 print(f"  -> モーター{motor.id}: 目標速度 {target_velocity:.1f} rad/s")
             await asyncio.sleep(2)
 
             # パターン3: 負方向回転
             print("\n📍 パターン3: 負方向回転 (-0.8 rad/s)")
             target_velocity = -0.8
+            await controller.set_target_velocities(
+                {motor.id: target_velocity for motor in MOTORS}
+            )
             for motor in MOTORS:
-                await controller.set_target_velocity(motor.id, target_velocity)
                 print(f"  -> モーター{motor.id}: 目標速度 {target_velocity:.1f} rad/s")
             await asyncio.sleep(3)
 
             # パターン4: 最終停止
             print("\n📍 パターン6: 最終停止")
+            await controller.set_target_velocities({motor.id: 0.0 for motor in MOTORS})
             for motor in MOTORS:
-                await controller.set_target_velocity(motor.id, 0.0)
                 print(f"  -> モーター{motor.id}: 目標速度 0.0 rad/s")
             await asyncio.sleep(2)
 
@@ -99,5 +113,11 @@ async def main() -> None:
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    try:
+        # uvloop がインストールされていれば使用し、イベントループのオーバーヘッドを減らす（任意）
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        asyncio.run(main(), loop_factory=uvloop.new_event_loop)
 # 実行コマンド: python -m src.samples.velocity_sample
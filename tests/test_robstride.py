@@ -0,0 +1,471 @@
+import asyncio
+import logging
+import struct
+from collections import deque
+from typing import Optional
+
+import pytest
+import serial
+
+from src.constants import CommandType, ParameterIndex, RunMode
+from src.robstride import (
+    _VERIFY_DELAYS,
+    RobStride,
+    RobStrideController,
+    RobStrideLimits,
+    _decode_can_id,
+    _response_key,
+)
+
+HOST_ID = 253
+
+
+def make_controller(
+    motors: list[RobStride],
+) -> tuple[RobStrideController, serial.Serial]:
+    """ループバックポート (loop://) を接続済みとしたコントローラーを生成する"""
+    controller = RobStrideController(port="loop://", motors=motors, host_id=HOST_ID)
+    port = serial.serial_for_url("loop://", timeout=0)
+    controller.serial = port
+    return controller, port
+
+
+def response_frame(comm_type: int, motor_id: int, data: bytes = bytes(8)) -> bytes:
+    """モーターからの応答フレーム (データエリア2の下位8ビットが送信元ID) を生成する"""
+    can_id_29bit = (comm_type << 24) | (motor_id << 8) | HOST_ID
+    encoded = struct.pack('>I', (can_id_29bit << 3) | 0b100)
+    return b'AT' + encoded + b'\x08' + data + b'\r\n'
+
+
+def feedback_frame(motor_id: int, mode: int, fault_bits: int = 0) -> bytes:
+    """フィードバック (タイプ2) フレーム。データエリア2の bit15-14 がモード状態, bit13-8 が故障情報"""
+    data_area2 = (mode << 14) | (fault_bits << 8) | motor_id
+    can_id_29bit = (0x02 << 24) | (data_area2 << 8) | HOST_ID
+    encoded = struct.pack('>I', (can_id_29bit << 3) | 0b100)
+    return b'AT' + encoded + b'\x08' + bytes(8) + b'\r\n'
+
+
+def stub_reply(controller: RobStrideController, reply: Optional[bytes]) -> None:
+    """単発の送受信を差し替え、常に同じ応答を返す"""
+
+    async def send_and_receive(frame: bytes) -> Optional[bytes]:
+        return reply
+
+    controller._send_and_receive = send_and_receive  # type: ignore[method-assign]
+
+
+def read_response(motor_id: int, index: int, value: bytes) -> bytes:
+    """パラメータ読み込みの応答フレーム (インデックスと4バイトの値) を生成する"""
+    return response_frame(0x11, motor_id, struct.pack('<H2x4s', index, value))
+
+
+def stub_io(
+    controller: RobStrideController, readbacks: dict[int, list[bytes]]
+) -> list[int]:
+    """送受信を差し替え、読み込みにはインデックスごとの値を順に返す。再読み込みしたインデックスを返す"""
+    reread: list[int] = []
+
+    async def send_and_receive_many(frames: list[bytes]) -> list[Optional[bytes]]:
+        responses: list[Optional[bytes]] = []
+        for frame in frames:
+            comm_type, _, motor_id = _decode_can_id(frame)
+            index = struct.unpack_from('<H', frame, 7)[0]
+            if comm_type == CommandType.READ_PARAM.value:
+                value = readbacks[index].pop(0)
+                responses.append(read_response(motor_id, index, value))
+            else:
+                responses.append(response_frame(0x02, motor_id))
+        return responses
+
+    async def read_parameter(motor_id: int, index: int) -> Optional[bytes]:
+        reread.append(index)
+        return readbacks[index].pop(0)
+
+    controller._send_and_receive_many = send_and_receive_many  # type: ignore[method-assign]
+    controller._read_parameter = read_parameter  # type: ignore[method-assign]
+    return reread
+
+
+# --- _read_frames ---
+
+
+def test_read_frames_skips_garbage_prefix() -> None:
+    controller, port = make_controller([RobStride(id=1, offset=0.0)])
+    frame = response_frame(0x02, 1)
+    port.write(b'\x00\xffxx' + frame)
+    assert controller._read_frames() == [frame]
+    assert controller._rxbuf == bytearray()
+
+
+def test_read_frames_keeps_split_header() -> None:
+    controller, port = make_controller([RobStride(id=1, offset=0.0)])
+    frame = response_frame(0x02, 1)
+    port.write(frame[:1])
+    assert controller._read_frames() == []
+    port.write(frame[1:])
+    assert controller._read_frames() == [frame]
+
+
+def test_read_frames_keeps_trailing_a_after_garbage() -> None:
+    controller, port = make_controller([RobStride(id=1, offset=0.0)])
+    frame = response_frame(0x02, 1)
+    port.write(b'garbage' + frame[:1])
+    assert controller._read_frames() == []
+    assert controller._rxbuf == bytearray(b'A')
+    port.write(frame[1:])
+    assert controller._read_frames() == [frame]
+
+
+def test_read_frames_carries_partial_frame_and_resyncs_on_bad_tail() -> None:
+    controller, port = make_controller([RobStride(id=1, offset=0.0)])
+    first = response_frame(0x02, 1)
+    second = response_frame(0x11, 1)
+    # 終端が壊れたフレームの後に、正常なフレームが2回に分かれて届く
+    port.write(b'AT' + bytes(13) + b'xx' + first + second[:10])
+    assert controller._read_frames() == [first]
+    port.write(second[10:])
+    assert controller._read_frames() == [second]
+
+
+# --- CAN ID と応答の振り分け ---
+
+
+def test_decode_can_id_of_request_frame() -> None:
+    controller, _ = make_controller([RobStride(id=5, offset=0.0)])
+    frame = controller._create_frame(CommandType.ENABLE, 5)
+    assert _decode_can_id(frame) == (CommandType.ENABLE.value, HOST_ID, 5)
+
+
+def test_decode_can_id_of_response_frame() -> None:
+    comm_type, data_area2, _ = _decode_can_id(response_frame(0x02, 7))
+    assert comm_type == 0x02
+    assert data_area2 & 0xFF == 7
+
+
+def test_dispatch_routes_by_motor_id() -> None:
+    controller, _ = make_controller(
+        [RobStride(id=1, offset=0.0), RobStride(id=2, offset=0.0)]
+    )
+
+    async def test() -> None:
+        loop = asyncio.get_running_loop()
+        futures: dict[int, asyncio.Future[bytes]] = {
+            motor_id: loop.create_future() for motor_id in (1, 2)
+        }
+        for motor_id, future in futures.items():
+            controller._pending[(motor_id, 0x02, 0)] = deque([future])
+        reply = response_frame(0x02, 2)
+        controller._dispatch_response(reply)
+        assert not futures[1].done()
+        assert futures[2].result() == reply
+
+    asyncio.run(test())
+
+
+def test_dispatch_discards_unsolicited_response() -> None:
+    controller, _ = make_controller([RobStride(id=1, offset=0.0)])
+    # 応答待ちが無い応答は例外を出さずに読み捨てる
+    controller._dispatch_response(response_frame(0x02, 1))
+
+
+# --- 書き込み後の読み戻し確認 ---
+
+
+def test_set_run_mode_retries_readback_until_applied() -> None:
+    controller, _ = make_controller([RobStride(id=1, offset=0.0)])
+    index = ParameterIndex.RUN_MODE.value
+    old = bytes([RunMode.POSITION_PP.value]) + bytes(3)
+    new = bytes([RunMode.VELOCITY.value]) + bytes(3)
+    reread = stub_io(controller, {index: [old, old, new]})
+
+    assert asyncio.run(controller.set_mode_velocity(1))
+    assert reread == [index, index]
+    assert controller.motors[1].get_current_mode() is RunMode.VELOCITY
+
+
+def test_set_run_mode_fails_after_backoff_exhausted() -> None:
+    controller, _ = make_controller([RobStride(id=1, offset=0.0)])
+    index = ParameterIndex.RUN_MODE.value
+    old = bytes([RunMode.POSITION_PP.value]) + bytes(3)
+    reread = stub_io(controller, {index: [old] * (len(_VERIFY_DELAYS) + 1)})
+
+    assert not asyncio.run(controller.set_mode_velocity(1))
+    assert len(reread) == len(_VERIFY_DELAYS)
+    assert controller.motors[1].get_current_mode() is None
+
+
+def test_set_float_parameters_rereads_only_unconfirmed_values() -> None:
+    controller, _ = make_controller([RobStride(id=1, offset=0.0)])
+    spd = ParameterIndex.LIMIT_SPD
+    cur = ParameterIndex.LIMIT_CUR
+    reread = stub_io(
+        controller,
+        {
+            spd.value: [struct.pack('<f', 3.0)],
+            cur.value: [struct.pack('<f', 0.0), struct.pack('<f', 0.5)],
+        },
+    )
+    params = [(spd, 3.0, "speed", "rad/s"), (cur, 0.5, "current", "A")]
+
+    assert asyncio.run(controller._set_float_parameters(1, params))
+    assert reread == [cur.value]
+
+
+def test_set_float_parameters_reports_mismatch() -> None:
+    controller, _ = make_controller([RobStride(id=1, offset=0.0)])
+    cur = ParameterIndex.LIMIT_CUR
+    stub_io(controller, {cur.value: [struct.pack('<f', 0.0)] * 10})
+
+    assert not asyncio.run(
+        controller._set_float_parameters(1, [(cur, 0.5, "current", "A")])
+    )
+
+
+# --- 有効化時の状態判定 ---
+
+
+def test_enable_accepts_run_state_and_prepares_position_frame() -> None:
+    controller, _ = make_controller([RobStride(id=1, offset=0.25)])
+    stub_reply(controller, feedback_frame(1, mode=2))
+
+    assert asyncio.run(controller.enable(1))
+    assert controller.motors[1].is_enabled()
+    frame, offset = controller._pos_targets[1]
+    assert offset == 0.25
+    assert _decode_can_id(frame) == (CommandType.WRITE_PARAM.value, HOST_ID, 1)
+    assert struct.unpack_from('<H', frame, 7)[0] == ParameterIndex.LOC_REF.value
+
+
+def test_enable_rejects_reset_state_and_logs_fault_bits(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    controller, _ = make_controller([RobStride(id=1, offset=0.0)])
+    stub_reply(controller, feedback_frame(1, mode=0, fault_bits=0x05))
+
+    with caplog.at_level(logging.ERROR, logger="src.robstride"):
+        assert not asyncio.run(controller.enable(1))
+    assert not controller.motors[1].is_enabled()
+    assert 1 not in controller._pos_targets
+    assert "Invalid status RESET (fault bits: 0x05)" in caplog.text
+
+
+def test_enable_fails_without_response() -> None:
+    controller, _ = make_controller([RobStride(id=1, offset=0.0)])
+    stub_reply(controller, None)
+
+    assert not asyncio.run(controller.enable(1))
+
+
+# --- 位置指令の高速送信 ---
+
+
+def enable_motors(controller: RobStrideController, *motor_ids: int) -> None:
+    """応答を差し替えて指定したモーターを有効化する"""
+
+    async def send_and_receive(frame: bytes) -> Optional[bytes]:
+        return feedback_frame(_decode_can_id(frame)[2], mode=2)
+
+    controller._send_and_receive = send_and_receive  # type: ignore[method-assign]
+    for motor_id in motor_ids:
+        assert asyncio.run(controller.enable(motor_id))
+
+
+def test_set_target_positions_fast_sends_all_frames_in_one_write() -> None:
+    controller, port = make_controller(
+        [RobStride(id=1, offset=0.5), RobStride(id=2, offset=-1.0)]
+    )
+    enable_motors(controller, 1, 2)
+
+    asyncio.run(controller.set_target_positions_fast({1: 1.0, 2: 2.0}))
+
+    sent = port.read(port.in_waiting)
+    assert len(sent) == 2 * 17
+    for frame, motor_id, expected in ((sent[:17], 1, 1.5), (sent[17:], 2, 1.0)):
+        assert frame[:2] == b'AT' and frame[-2:] == b'\r\n'
+        assert _decode_can_id(frame) == (
+            CommandType.WRITE_PARAM.value,
+            HOST_ID,
+            motor_id,
+        )
+        assert struct.unpack_from('<H', frame, 7)[0] == ParameterIndex.LOC_REF.value
+        assert struct.unpack_from('<f', frame, 11)[0] == expected
+        # 送信のみのフレームの応答を読み捨てる枠が1つずつ積まれる
+        waiters = controller._pending[(motor_id, 0x02, 0)]
+        assert len(waiters) == 1 and isinstance(waiters[0], float)
+
+
+def test_set_target_positions_fast_sends_nothing_if_any_motor_disabled() -> None:
+    controller, port = make_controller(
+        [RobStride(id=1, offset=0.0), RobStride(id=2, offset=0.0)]
+    )
+    enable_motors(controller, 1)
+    before = bytes(controller._pos_targets[1][0])
+
+    asyncio.run(controller.set_target_positions_fast({1: 1.0, 2: 2.0}))
+
+    assert port.in_waiting == 0
+    assert bytes(controller._pos_targets[1][0]) == before
+
+
+# --- 送信のみのフレームの応答 ---
+
+
+async def enable_after_send_only(
+    controller: RobStrideController, stale_ack: Optional[bytes]
+) -> bool:
+    """送信のみのフレームの直後に有効化し、(あれば) その応答の後に有効化の応答を返す"""
+    await controller._write_parameter_nowait(1, ParameterIndex.SPD_REF.value, 1.0)
+    enable = asyncio.create_task(controller.enable(1))
+    await asyncio.sleep(0)
+    if stale_ack is not None:
+        controller._dispatch_response(stale_ack)
+    # 有効化の応答待ちが登録されるまで待ってから応答を返す
+    waiters = controller._pending[(1, 0x02, 0)]
+    while not any(isinstance(waiter, asyncio.Future) for waiter in waiters):
+        await asyncio.sleep(0.001)
+    controller._dispatch_response(feedback_frame(1, mode=2))
+    enabled: bool = await enable
+    return enabled
+
+
+def test_send_only_ack_does_not_complete_later_waiter() -> None:
+    controller, _ = make_controller([RobStride(id=1, offset=0.0)])
+    # 送信のみのフレームへの応答 (RESET状態) は有効化の応答として扱われない
+    assert asyncio.run(enable_after_send_only(controller, feedback_frame(1, mode=0)))
+
+
+def test_lost_send_only_ack_does_not_swallow_enable_response() -> None:
+    controller, _ = make_controller([RobStride(id=1, offset=0.0)])
+    controller.response_timeout = 0.05
+    # 送信のみのフレームの応答が失われても、枠の期限切れを待ってから応答待ちを登録する
+    assert asyncio.run(enable_after_send_only(controller, None))
+
+
+# --- リミット設定 ---
+
+
+def test_send_and_receive_many_with_no_frames_writes_nothing() -> None:
+    controller, port = make_controller([RobStride(id=1, offset=0.0)])
+    assert asyncio.run(controller._send_and_receive_many([])) == []
+    assert port.in_waiting == 0
+
+
+def test_apply_limits_without_fields_for_current_mode_writes_nothing() -> None:
+    # PP モードのリミットのみ設定されたモーターを Velocity モードで使う
+    motor = RobStride(id=1, offset=0.0, limits=RobStrideLimits(pp_vel_max=1.0))
+    controller, port = make_controller([motor])
+    motor._set_enabled(True)
+    motor._set_mode(RunMode.VELOCITY)
+
+    assert asyncio.run(controller.apply_velocity_limits(1))
+    assert port.in_waiting == 0
+
+
+# --- パラメータ読み込みの応答 ---
+
+
+def test_response_key_includes_read_index() -> None:
+    controller, _ = make_controller([RobStride(id=3, offset=0.0)])
+    index = ParameterIndex.LOC_REF.value
+    assert _response_key(controller._read_param_frame(3, index)) == (3, 0x11, index)
+    write = controller._create_frame(CommandType.ENABLE, 3)
+    assert _response_key(write) == (3, 0x02, 0)
+
+
+def test_dispatch_matches_read_reply_by_index() -> None:
+    controller, _ = make_controller([RobStride(id=1, offset=0.0)])
+    spd = ParameterIndex.LIMIT_SPD.value
+    cur = ParameterIndex.LIMIT_CUR.value
+
+    async def test() -> None:
+        loop = asyncio.get_running_loop()
+        futures: dict[int, asyncio.Future[bytes]] = {
+            index: loop.create_future() for index in (spd, cur)
+        }
+        for index, future in futures.items():
+            controller._pending[(1, 0x11, index)] = deque([future])
+        # 送信順と異なる順で応答が届いても、インデックスで要求と対応付ける
+        reply = read_response(1, cur, struct.pack('<f', 0.5))
+        controller._dispatch_response(reply)
+        assert not futures[spd].done()
+        assert futures[cur].result() == reply
+
+    asyncio.run(test())
+
+
+# --- 速度指令の一括送信 ---
+
+
+def test_set_target_velocities_sends_nothing_if_any_id_unknown() -> None:
+    controller, port = make_controller([RobStride(id=1, offset=0.0)])
+
+    asyncio.run(controller.set_target_velocities({1: 1.0, 9: 1.0}))
+
+    assert port.in_waiting == 0
+    assert controller._pending == {}
+
+
+def test_set_target_velocities_sends_all_frames_in_one_write() -> None:
+    controller, port = make_controller(
+        [RobStride(id=1, offset=0.0), RobStride(id=2, offset=0.0)]
+    )
+
+    asyncio.run(controller.set_target_velocities({1: 1.0, 2: -2.0}))
+
+    sent = port.read(port.in_waiting)
+    assert [_decode_can_id(sent[i : i + 17])[2] for i in (0, 17)] == [1, 2]
+    assert [struct.unpack_from('<f', sent, i + 11)[0] for i in (0, 17)] == [1.0, -2.0]
+
+
+# --- 送信レート制限 ---
+
+
+def sent_velocities(port: serial.Serial) -> list[float]:
+    """ポートに書き込まれた目標速度を送信順に返す"""
+    sent = port.read(port.in_waiting)
+    return [struct.unpack_from('<f', sent, i + 11)[0] for i in range(0, len(sent), 17)]
+
+
+def test_rate_limit_always_passes_stop_command() -> None:
+    limits = RobStrideLimits(min_command_period_s=0.05)
+    controller, port = make_controller([RobStride(id=1, offset=0.0, limits=limits)])
+
+    async def test() -> None:
+        for velocity in (1.0, 2.0, 0.0):
+            await controller.set_target_velocity(1, velocity)
+        assert sent_velocities(port) == [1.0, 0.0]
+        # 停止指令より前に保留した値は、間隔の経過後も送信しない
+        await asyncio.sleep(0.1)
+        assert sent_velocities(port) == []
+
+    asyncio.run(test())
+
+
+def test_rate_limit_sends_latest_velocity_after_period() -> None:
+    limits = RobStrideLimits(min_command_period_s=0.05)
+    controller, port = make_controller([RobStride(id=1, offset=0.0, limits=limits)])
+
+    async def test() -> None:
+        for velocity in (1.0, -1.0, 2.0):
+            await controller.set_target_velocity(1, velocity)
+        assert sent_velocities(port) == [1.0]
+        await asyncio.sleep(0.1)
+        assert sent_velocities(port) == [2.0]
+
+    asyncio.run(test())
+
+
+# --- 接続 ---
+
+
+def test_connect_accepts_url_port_and_disconnects() -> None:
+    controller = RobStrideController(port="loop://", motors=[], host_id=HOST_ID)
+
+    async def test() -> None:
+        assert await controller.connect()
+        assert controller.serial is not None and controller.serial.is_open
+        await controller.disconnect()
+        assert controller.serial is None
+        assert controller._reader_task is None
+
+    asyncio.run(test())